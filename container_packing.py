@@ -3,14 +3,52 @@
 """
 集装箱装载优化计算
 3D Bin Packing Problem Solver
+
+依赖：numpy（必需）；numba（需要，用于编译装箱内核）。
+没有 numba 时内核退化为纯 Python 函数，结果相同但慢一个数量级，仅用于保证正确性。
 """
 
-import json
+import hashlib
+import inspect
+import warnings
 from typing import List, Tuple, Dict
 from dataclasses import dataclass
-import copy
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # 没有 numba 时退化为普通 Python 函数
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    # 由 packing_kernels_build.py 预编译（AOT）的内核
+    import packing_kernels
+except ImportError:
+    packing_kernels = None
+
+# 几何比较的容差（米）
+EPS = 0.001
+
+# 不在箱底时，箱子底面至少要有这一比例落在下方箱子的顶面上
+MIN_SUPPORT = 1.0
+
+# x 向空间索引的分段宽度（米），重叠检测只检查候选位置所在分段内的箱子
+GRID_SLAB = 0.5
 
-@dataclass
+# 已放置货物的记录格式
+POS_DT = np.dtype([('x', 'f8'), ('y', 'f8'), ('z', 'f8'),
+                   ('l', 'f8'), ('w', 'f8'), ('h', 'f8'),
+                   ('name_id', 'i4'), ('box_id', 'i4')])
+
+@dataclass(slots=True)
 class Box:
     """货物箱子"""
     name: str
@@ -28,23 +66,34 @@ class Box:
     
     def get_rotations(self):
         """获取所有可能的旋转方向"""
-        l, w, h = self.length, self.width, self.height
-        rotations = [
-            (l, w, h),
-            (l, h, w),
-            (w, l, h),
-            (w, h, l),
-            (h, l, w),
-            (h, w, l)
-        ]
-        # 去重
-        unique_rotations = []
-        for rot in rotations:
-            if rot not in unique_rotations:
-                unique_rotations.append(rot)
-        return unique_rotations
-
-@dataclass
+        return _rotations(self.length, self.width, self.height)
+
+@lru_cache(maxsize=None)
+def _rotations(l: float, w: float, h: float) -> Tuple[Tuple[float, float, float], ...]:
+    """按尺寸缓存的去重旋转方向"""
+    rotations = (
+        (l, w, h),
+        (l, h, w),
+        (w, l, h),
+        (w, h, l),
+        (h, l, w),
+        (h, w, l)
+    )
+    # 去重
+    seen = set()
+    unique_rotations = []
+    for rot in rotations:
+        if rot not in seen:
+            seen.add(rot)
+            unique_rotations.append(rot)
+    return tuple(unique_rotations)
+
+@lru_cache(maxsize=None)
+def _rotation_array(l: float, w: float, h: float) -> np.ndarray:
+    """去重旋转方向的数组形式，供编译内核使用：长条形箱子 3 行，正方体 1 行"""
+    return np.array(_rotations(l, w, h), dtype=np.float64)
+
+@dataclass(slots=True, frozen=True)
 class Position:
     """位置信息"""
     x: float
@@ -56,84 +105,472 @@ class Position:
     box_name: str
     box_id: int
 
+@njit(cache=True)
+def _slab_range(x0, x1, slab, n_slabs):
+    """x 区间 [x0, x1) 覆盖的第一个和最后一个分段"""
+    first = int(max(x0, 0.0) / slab)
+    last = int(max(x1 - EPS, 0.0) / slab)
+    return min(first, n_slabs - 1), min(last, n_slabs - 1)
+
+@njit(cache=True)
+def _grid_insert(grid_items, grid_count, slab, aabb, i):
+    """将第 i 个包围盒登记到它覆盖的分段中；有分段已满时不登记并返回 False"""
+    first, last = _slab_range(aabb[i, 0], aabb[i, 3], slab, grid_count.size)
+    for c in range(first, last + 1):
+        if grid_count[c] == grid_items.shape[1]:
+            return False
+    for c in range(first, last + 1):
+        grid_items[c, grid_count[c]] = i
+        grid_count[c] += 1
+    return True
+
+@njit(cache=True)
+def _find_pos(aabb, grid_items, grid_count, slab, container_length, container_width,
+              container_height, length, width, height, cand_x, cand_y, cand_z):
+    """按候选顺序返回第一个可放置（不重叠且底面有足够支撑）的位置 (ok, x, y, z)，候选位置需已排序"""
+    for k in range(cand_x.size):
+        x = cand_x[k]
+        y = cand_y[k]
+        z = cand_z[k]
+        if (x + length > container_length + EPS or
+                y + width > container_width + EPS or
+                z + height > container_height + EPS):
+            continue
+        x1 = x + length
+        y1 = y + width
+        z1 = z + height
+        ok = True
+        # 只检查与候选位置处于相同 x 分段的箱子
+        first, last = _slab_range(x, x1, slab, grid_count.size)
+        for c in range(first, last + 1):
+            for m in range(grid_count[c]):
+                j = grid_items[c, m]
+                # 三个轴上的重叠长度都超过容差才算相交
+                if ((min(x1, aabb[j, 3]) - max(x, aabb[j, 0]) > EPS) &
+                        (min(y1, aabb[j, 4]) - max(y, aabb[j, 1]) > EPS) &
+                        (min(z1, aabb[j, 5]) - max(z, aabb[j, 2]) > EPS)):
+                    ok = False
+                    break
+            if not ok:
+                break
+        if ok and z > EPS:
+            # 悬空检查：统计同一高度上的顶面与箱子底面的重叠面积
+            support = 0.0
+            for c in range(first, last + 1):
+                for m in range(grid_count[c]):
+                    j = grid_items[c, m]
+                    # 跨多个分段的箱子只在查询范围内它所在的第一个分段计数一次
+                    box_first, _ = _slab_range(aabb[j, 0], aabb[j, 3], slab, grid_count.size)
+                    if abs(aabb[j, 5] - z) <= EPS and c == max(first, box_first):
+                        support += (max(min(x1, aabb[j, 3]) - max(x, aabb[j, 0]), 0.0) *
+                                    max(min(y1, aabb[j, 4]) - max(y, aabb[j, 1]), 0.0))
+            ok = support >= MIN_SUPPORT * length * width - EPS * EPS
+        if ok:
+            return True, x, y, z
+    return False, 0.0, 0.0, 0.0
+
+@njit(cache=True)
+def _fitting_points(points, rotations, container_length, container_width, container_height):
+    """只保留在三个方向上都能容纳各旋转方向最短边的极点（保持原有顺序）"""
+    fits = ((points[:, 0] <= container_length - rotations[:, 0].min() + EPS) &
+            (points[:, 1] <= container_width - rotations[:, 1].min() + EPS) &
+            (points[:, 2] <= container_height - rotations[:, 2].min() + EPS))
+    return points[fits]
+
+@njit(cache=True)
+def _find_pos_rotations(aabb, grid_items, grid_count, slab, container_length,
+                        container_width, container_height, rotations,
+                        cand_x, cand_y, cand_z):
+    """依次尝试各旋转方向，返回 (ok, 旋转方向序号, x, y, z)"""
+    for r in range(rotations.shape[0]):
+        ok, x, y, z = _find_pos(aabb, grid_items, grid_count, slab, container_length,
+                                container_width, container_height, rotations[r, 0],
+                                rotations[r, 1], rotations[r, 2], cand_x, cand_y, cand_z)
+        if ok:
+            return True, r, x, y, z
+    return False, -1, 0.0, 0.0, 0.0
+
+@njit(cache=True)
+def _project(aabb, grid_items, grid_count, slab, point, axis):
+    """将点沿 axis 轴负方向投影到最近的箱子表面或容器壁，返回该轴的新坐标"""
+    u = (axis + 1) % 3
+    v = (axis + 2) % 3
+    if axis == 0:
+        # 沿 x 投影：从点所在分段向前逐段查找
+        first = 0
+        last, _ = _slab_range(point[0], point[0], slab, grid_count.size)
+    else:
+        # 沿 y/z 投影：x 向覆盖该点的箱子一定登记在这一两个分段中
+        first, last = _slab_range(point[0], point[0] + 2 * EPS, slab, grid_count.size)
+    best = 0.0
+    for c in range(last, first - 1, -1):
+        for m in range(grid_count[c]):
+            j = grid_items[c, m]
+            # 另外两个轴上覆盖该点、且位于该点后方的箱子
+            if (aabb[j, u] - EPS <= point[u] and point[u] < aabb[j, u + 3] - EPS and
+                    aabb[j, v] - EPS <= point[v] and point[v] < aabb[j, v + 3] - EPS and
+                    aabb[j, axis + 3] <= point[axis] + EPS and aabb[j, axis + 3] > best):
+                best = aabb[j, axis + 3]
+        # 更前面分段中未检查的箱子右边界都小于 c * slab + EPS，不会更近
+        if axis == 0 and best >= c * slab + EPS:
+            break
+    return best
+
+@njit(cache=True)
+def _contains(aabb, j, px, py, pz):
+    """点是否位于第 j 个箱子内部（落在箱子起始面上也算）"""
+    return (aabb[j, 0] - EPS <= px and px < aabb[j, 3] - EPS and
+            aabb[j, 1] - EPS <= py and py < aabb[j, 4] - EPS and
+            aabb[j, 2] - EPS <= pz and pz < aabb[j, 5] - EPS)
+
+@njit(cache=True)
+def _zxy_less(p, q):
+    """按 (z, x, y) 比较两个点"""
+    if p[2] != q[2]:
+        return p[2] < q[2]
+    if p[0] != q[0]:
+        return p[0] < q[0]
+    return p[1] < q[1]
+
+@njit(cache=True)
+def _update_extreme_points(aabb, n, grid_items, grid_count, slab, points,
+                           container_length, container_width, container_height):
+    """aabb[n-1] 放置后生成新的极点，删除被占用、超出容器或悬空的极点，返回按 (z, x, y) 排序的新极点"""
+    m = points.shape[0]
+    cand = np.empty((m + 9, 3), dtype=np.float64)
+    cand[:m] = points
+    k = m
+    for corner_axis in range(3):
+        corner = aabb[n - 1, :3].copy()
+        corner[corner_axis] = aabb[n - 1, corner_axis + 3]
+        # 角点本身（紧贴新箱子，顶面角点有完整支撑）及其沿另外两个轴的投影
+        cand[k] = corner
+        k += 1
+        for axis in range(3):
+            if axis != corner_axis:
+                cand[k] = corner
+                cand[k, axis] = _project(aabb, grid_items, grid_count, slab, corner, axis)
+                k += 1
+    
+    keep = np.zeros(cand.shape[0], dtype=np.bool_)
+    for i in range(cand.shape[0]):
+        px = cand[i, 0]
+        py = cand[i, 1]
+        pz = cand[i, 2]
+        if (px >= container_length - EPS or py >= container_width - EPS or
+                pz >= container_height - EPS):
+            continue
+        # 原有极点在此之前未被占用，只需检查新放置的箱子；
+        # 新增极点检查 x 向覆盖该点的分段内的全部箱子
+        if i < m:
+            keep[i] = not _contains(aabb, n - 1, px, py, pz)
+            continue
+        occupied = False
+        supported = pz <= EPS
+        first, last = _slab_range(px, px + 2 * EPS, slab, grid_count.size)
+        for c in range(first, last + 1):
+            for mm in range(grid_count[c]):
+                j = grid_items[c, mm]
+                if _contains(aabb, j, px, py, pz):
+                    occupied = True
+                    break
+                if (abs(aabb[j, 5] - pz) <= EPS and
+                        aabb[j, 0] - EPS <= px and px < aabb[j, 3] - EPS and
+                        aabb[j, 1] - EPS <= py and py < aabb[j, 4] - EPS):
+                    supported = True
+            if occupied:
+                break
+        # 要求完全支撑时，下方没有顶面的悬空极点上放不了任何箱子
+        keep[i] = not occupied and (supported or MIN_SUPPORT < 1.0)
+    # 原有极点已排序去重，只需对新增的极点排序后归并
+    old = cand[:m][keep[:m]]
+    new = np.round(cand[m:][keep[m:]], 6)
+    # 底-深-左优先：z 最小，其次 x，最后 y（新增极点至多 9 个，插入排序即可）
+    for i in range(1, new.shape[0]):
+        j = i
+        while j > 0 and _zxy_less(new[j], new[j - 1]):
+            tmp = new[j].copy()
+            new[j] = new[j - 1]
+            new[j - 1] = tmp
+            j -= 1
+    
+    merged = np.empty((old.shape[0] + new.shape[0], 3), dtype=np.float64)
+    i = 0
+    j = 0
+    k = 0
+    while i < old.shape[0] or j < new.shape[0]:
+        if j == new.shape[0] or (i < old.shape[0] and not _zxy_less(new[j], old[i])):
+            point = old[i]
+            i += 1
+        else:
+            point = new[j]
+            j += 1
+        # 去除重复的极点
+        if (k == 0 or point[0] != merged[k - 1, 0] or point[1] != merged[k - 1, 1] or
+                point[2] != merged[k - 1, 2]):
+            merged[k] = point
+            k += 1
+    return merged[:k]
+
+@njit(cache=True)
+def _pack_repeated(aabb, n, grid_items, grid_count, slab, points, rotations,
+                   rotation_used, container_length, container_width, container_height,
+                   remaining_volume):
+    """反复放置同一尺寸的箱子，直到放不下或 aabb / 空间索引容量用尽
+    
+    返回 (n, points, 是否需要扩容)，rotation_used[i] 记录第 i 个箱子使用的旋转方向
+    """
+    volume = rotations[0, 0] * rotations[0, 1] * rotations[0, 2]
+    while remaining_volume + 1e-9 >= volume:
+        if n == aabb.shape[0] or grid_count.max() == grid_items.shape[1]:
+            return n, points, True
+        cand = _fitting_points(points, rotations, container_length, container_width,
+                               container_height)
+        ok, r, x, y, z = _find_pos_rotations(aabb, grid_items, grid_count, slab,
+                                             container_length, container_width,
+                                             container_height, rotations,
+                                             cand[:, 0], cand[:, 1], cand[:, 2])
+        if not ok:
+            break
+        aabb[n, 0] = x
+        aabb[n, 1] = y
+        aabb[n, 2] = z
+        aabb[n, 3] = x + rotations[r, 0]
+        aabb[n, 4] = y + rotations[r, 1]
+        aabb[n, 5] = z + rotations[r, 2]
+        rotation_used[n] = r
+        _grid_insert(grid_items, grid_count, slab, aabb, n)
+        n += 1
+        points = _update_extreme_points(aabb, n, grid_items, grid_count, slab, points,
+                                        container_length, container_width,
+                                        container_height)
+        remaining_volume -= volume
+    return n, points, False
+
+def _kernel_version() -> int:
+    """内核源码及编译时固化的常量的指纹，用于识别过期的预编译模块"""
+    kernels = (_slab_range, _grid_insert, _find_pos, _fitting_points, _find_pos_rotations,
+               _project, _contains, _zxy_less, _update_extreme_points, _pack_repeated)
+    digest = hashlib.sha256(repr((EPS, MIN_SUPPORT)).encode())
+    for kernel in kernels:
+        digest.update(inspect.getsource(getattr(kernel, 'py_func', kernel)).encode())
+    return int.from_bytes(digest.digest()[:8], 'little', signed=True)
+
+KERNEL_VERSION = _kernel_version()
+
+if (packing_kernels is not None and
+        getattr(packing_kernels, 'version', lambda: None)() != KERNEL_VERSION):
+    warnings.warn("packing_kernels 与当前内核源码不一致，改用 JIT 编译；"
+                  "请重新运行 packing_kernels_build.py", RuntimeWarning)
+    packing_kernels = None
+
+if packing_kernels is not None:
+    # 使用预编译的内核，省去首次调用时的 JIT 编译
+    _slab_range = packing_kernels.slab_range
+    _grid_insert = packing_kernels.grid_insert
+    _find_pos = packing_kernels.find_pos
+    _fitting_points = packing_kernels.fitting_points
+    _find_pos_rotations = packing_kernels.find_pos_rotations
+    _update_extreme_points = packing_kernels.update_extreme_points
+    _pack_repeated = packing_kernels.pack_repeated
+
+
+def _warm_up() -> None:
+    """预热 JIT 内核（cache=True 时从磁盘缓存加载），避免首次装箱时阻塞编译
+    
+    只在作为脚本运行时调用，单纯导入（包括 AOT 构建脚本）不会触发编译；
+    已加载预编译内核或没有 numba 时什么也不做。
+    """
+    if packing_kernels is not None or not NUMBA_AVAILABLE:
+        return
+    aabb = np.zeros((1, 6), dtype=np.float64)
+    grid_items = np.zeros((1, 1), dtype=np.int64)
+    grid_count = np.zeros(1, dtype=np.int64)
+    points = np.zeros((2, 3), dtype=np.float64)
+    rotations = np.ones((1, 3), dtype=np.float64)
+    # 只有一个极点时列切片是连续数组，多个极点时不是，两种类型都要编译
+    for cand in (points[:1], points):
+        _find_pos_rotations(aabb, grid_items, grid_count, 1.0, 1.0, 1.0, 1.0, rotations,
+                            cand[:, 0], cand[:, 1], cand[:, 2])
+    _pack_repeated(aabb, 0, grid_items, grid_count, 1.0, points, rotations,
+                   np.zeros(1, dtype=np.int64), 1.0, 1.0, 1.0, 1.0)
+    _grid_insert(grid_items, grid_count, 1.0, aabb, 0)
+
 class Container:
     """集装箱"""
     def __init__(self, length: float, width: float, height: float):
         self.length = length
         self.width = width
         self.height = height
-        self.placed_boxes: List[Position] = []
+        self._volume = length * width * height
+        # 已放置货物的总体积，每次放置时累加
+        self._used_volume = 0.0
+        # 货物名称表，记录中以 name_id 引用
+        self.name_table: List[str] = []
+        self._name_ids: Dict[str, int] = {}
+        # 已放置货物的记录及包围盒 (x0, y0, z0, x1, y1, z1)，按容量倍增
+        self._pos = np.empty(16, dtype=POS_DT)
+        self._aabb = np.empty((16, 6), dtype=np.float64)
+        self._n = 0
+        # x 向分段空间索引：每段登记与之重叠的箱子序号，每段容量按需倍增
+        self._slab = GRID_SLAB
+        n_slabs = max(1, int(np.ceil(length / self._slab)))
+        self._grid_items = np.empty((n_slabs, 16), dtype=np.int64)
+        self._grid_count = np.zeros(n_slabs, dtype=np.int64)
+        # 极点（Extreme Point）候选位置，按 (z, x, y) 排序
+        self._extreme_points = np.zeros((1, 3), dtype=np.float64)
+        # 自上次放置以来已确认放不下的箱子尺寸；状态不变时同样的搜索必然失败
+        self._failed_dims: set = set()
+    
+    @property
+    def positions(self) -> np.ndarray:
+        """已放置货物的记录（POS_DT 结构化数组）"""
+        return self._pos[:self._n]
+    
+    @property
+    def placed_boxes(self) -> List[Position]:
+        """已放置货物的位置信息"""
+        return [Position(float(p['x']), float(p['y']), float(p['z']),
+                         float(p['l']), float(p['w']), float(p['h']),
+                         self.name_table[p['name_id']], int(p['box_id']))
+                for p in self.positions]
+    
+    @property
+    def extreme_points(self) -> List[Tuple[float, float, float]]:
+        """当前的极点，按 (z, x, y) 排序"""
+        return [tuple(p) for p in self._extreme_points.tolist()]
         
     def volume(self):
-        return self.length * self.width * self.height
+        return self._volume
     
     def used_volume(self):
-        return sum(p.length * p.width * p.height for p in self.placed_boxes)
+        return self._used_volume
     
     def available_volume(self):
-        return self.volume() - self.used_volume()
+        return self._volume - self._used_volume
     
     def can_place(self, x: float, y: float, z: float, 
                   length: float, width: float, height: float) -> bool:
-        """检查是否可以在指定位置放置货物"""
-        # 检查是否超出容器边界
-        if x + length > self.length + 0.001:  # 添加小的容差
-            return False
-        if y + width > self.width + 0.001:
-            return False
-        if z + height > self.height + 0.001:
-            return False
-        
-        # 检查是否与已放置的货物重叠
-        for placed in self.placed_boxes:
-            if self._intersects(x, y, z, length, width, height, placed):
-                return False
-        
-        return True
+        """检查是否可以在指定位置放置货物（不超出容器、不重叠且底面有足够支撑）"""
+        # 与搜索使用同一个内核，只给出这一个候选位置
+        ok, _, _, _ = _find_pos(self._aabb, self._grid_items, self._grid_count, self._slab,
+                                self.length, self.width, self.height, length, width, height,
+                                np.array([x], dtype=np.float64), np.array([y], dtype=np.float64),
+                                np.array([z], dtype=np.float64))
+        return bool(ok)
+    
+    def _grow(self):
+        """记录和包围盒数组容量倍增"""
+        grown = np.empty(2 * self._pos.shape[0], dtype=POS_DT)
+        grown[:self._n] = self._pos
+        self._pos = grown
+        grown_aabb = np.empty((2 * self._aabb.shape[0], 6), dtype=np.float64)
+        grown_aabb[:self._n] = self._aabb
+        self._aabb = grown_aabb
+    
+    def _grow_grid(self):
+        """空间索引每段容量倍增"""
+        grown = np.empty((self._grid_items.shape[0], 2 * self._grid_items.shape[1]),
+                         dtype=np.int64)
+        grown[:, :self._grid_items.shape[1]] = self._grid_items
+        self._grid_items = grown
+    
+    def _name_id(self, name: str) -> int:
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self.name_table)
+            self.name_table.append(name)
+        return name_id
     
-    def _intersects(self, x: float, y: float, z: float,
-                    length: float, width: float, height: float,
-                    placed: Position) -> bool:
-        """检查两个箱子是否相交"""
-        return not (x + length <= placed.x + 0.001 or
-                   placed.x + placed.length <= x + 0.001 or
-                   y + width <= placed.y + 0.001 or
-                   placed.y + placed.width <= y + 0.001 or
-                   z + height <= placed.z + 0.001 or
-                   placed.z + placed.height <= z + 0.001)
+    def _record(self, x: float, y: float, z: float,
+                length: float, width: float, height: float,
+                name: str, box_id: int):
+        """记录新放置的箱子及其包围盒，并更新极点"""
+        if self._n == self._pos.shape[0]:
+            self._grow()
+        self._pos[self._n] = (x, y, z, length, width, height, self._name_id(name), box_id)
+        self._aabb[self._n] = (x, y, z, x + length, y + width, z + height)
+        self._used_volume += float(length * width * height)
+        while not _grid_insert(self._grid_items, self._grid_count, self._slab,
+                               self._aabb, self._n):
+            self._grow_grid()
+        self._n += 1
+        self._extreme_points = _update_extreme_points(
+            self._aabb, self._n, self._grid_items, self._grid_count, self._slab,
+            self._extreme_points, self.length, self.width, self.height)
+        self._failed_dims.clear()
     
     def find_placement_position(self, box_length: float, box_width: float, 
                                box_height: float) -> Tuple[bool, float, float, float]:
-        """寻找可以放置货物的位置"""
-        # 尝试的候选位置
-        candidate_positions = [(0, 0, 0)]
-        
-        # 基于已放置的箱子生成候选位置
-        for placed in self.placed_boxes:
-            # 在已放置箱子的右侧、前侧、上方生成候选位置
-            candidate_positions.append((placed.x + placed.length, placed.y, placed.z))
-            candidate_positions.append((placed.x, placed.y + placed.width, placed.z))
-            candidate_positions.append((placed.x, placed.y, placed.z + placed.height))
-        
-        # 对候选位置排序：优先选择z值小的（从底部开始），然后是x值小的，最后是y值小的
-        candidate_positions.sort(key=lambda p: (p[2], p[0], p[1]))
-        
-        for x, y, z in candidate_positions:
-            if self.can_place(x, y, z, box_length, box_width, box_height):
-                return True, x, y, z
+        """在极点中按优先顺序寻找第一个可以放置货物的位置"""
+        rotation = np.array([[box_length, box_width, box_height]], dtype=np.float64)
+        ok, _, x, y, z = self._find_placement(rotation)
+        return ok, x, y, z
+    
+    def _find_placement(self, rotations: np.ndarray) -> Tuple[bool, int, float, float, float]:
+        """在极点中按优先顺序为各旋转方向寻找第一个可以放置货物的位置
         
-        return False, 0, 0, 0
+        返回 (ok, 旋转方向序号, x, y, z)
+        """
+        # 只保留三个方向上都放得下该箱子的极点
+        cand = _fitting_points(self._extreme_points, rotations,
+                               self.length, self.width, self.height)
+        if cand.shape[0] == 0:
+            return False, -1, 0.0, 0.0, 0.0
+        return _find_pos_rotations(self._aabb, self._grid_items, self._grid_count, self._slab,
+                                   self.length, self.width, self.height, rotations,
+                                   cand[:, 0], cand[:, 1], cand[:, 2])
     
     def place_box(self, box: Box, box_id: int) -> bool:
         """尝试放置一个箱子"""
-        # 尝试所有可能的旋转方向
-        for length, width, height in box.get_rotations():
-            can_place, x, y, z = self.find_placement_position(length, width, height)
-            if can_place:
-                position = Position(x, y, z, length, width, height, box.name, box_id)
-                self.placed_boxes.append(position)
-                return True
-        return False
+        if box.dimensions() in self._failed_dims:
+            return False
+        # 在一次内核调用中尝试所有不同的旋转方向
+        rotations = _rotation_array(box.length, box.width, box.height)
+        can_place, r, x, y, z = self._find_placement(rotations)
+        if not can_place:
+            self._failed_dims.add(box.dimensions())
+            return False
+        length, width, height = rotations[r]
+        self._record(x, y, z, length, width, height, box.name, box_id)
+        return True
+    
+    def place_until_full(self, box: Box, first_id: int = 1) -> int:
+        """反复放置同一种箱子直到放不下，编号从 first_id 开始，返回放入的数量"""
+        if box.dimensions() in self._failed_dims:
+            return 0
+        rotations = _rotation_array(box.length, box.width, box.height)
+        name_id = self._name_id(box.name)
+        start = self._n
+        while True:
+            rotation_used = np.empty(self._aabb.shape[0], dtype=np.int64)
+            n_before = self._n
+            self._n, self._extreme_points, need_grow = _pack_repeated(
+                self._aabb, self._n, self._grid_items, self._grid_count, self._slab,
+                self._extreme_points, rotations, rotation_used,
+                self.length, self.width, self.height, self.available_volume())
+            # 按切片一次写入内核新放置的箱子
+            new = slice(n_before, self._n)
+            dims = rotations[rotation_used[new]]
+            records = self._pos[new]
+            records['x'] = self._aabb[new, 0]
+            records['y'] = self._aabb[new, 1]
+            records['z'] = self._aabb[new, 2]
+            records['l'] = dims[:, 0]
+            records['w'] = dims[:, 1]
+            records['h'] = dims[:, 2]
+            records['name_id'] = name_id
+            records['box_id'] = np.arange(n_before, self._n) - start + first_id
+            self._used_volume += float(dims.prod(axis=1).sum())
+            if not need_grow:
+                if self._n > start:
+                    self._failed_dims.clear()
+                self._failed_dims.add(box.dimensions())
+                return self._n - start
+            if self._n == self._aabb.shape[0]:
+                self._grow()
+            if self._grid_count.max() == self._grid_items.shape[1]:
+                self._grow_grid()
 
 def solve_packing_problem():
     """解决装箱问题"""
@@ -147,17 +584,17 @@ def solve_packing_problem():
     print(f"集装箱尺寸: {container_length}m × {container_width}m × {container_height}m")
     print(f"集装箱容积: {container.volume():.2f} 立方米\n")
     
-    # 定义货物（转换为米）
-    boxes = []
+    # 定义货物（转换为米），每种货物一个带数量的 Box
+    cargo = []
     
     # 1. lyocell：117×70×110cm，7包
-    boxes.extend([Box("lyocell", 1.17, 0.70, 1.10, 1, i+1) for i in range(7)])
+    cargo.append(Box("lyocell", 1.17, 0.70, 1.10, 7))
     
     # 2. viscose：110×110×80cm，2包
-    boxes.extend([Box("viscose", 1.10, 1.10, 0.80, 1, i+1) for i in range(2)])
+    cargo.append(Box("viscose", 1.10, 1.10, 0.80, 2))
     
     # 3. 仿羽绒：130×88×80cm，8包
-    boxes.extend([Box("仿羽绒", 1.30, 0.88, 0.80, 1, i+1) for i in range(8)])
+    cargo.append(Box("仿羽绒", 1.30, 0.88, 0.80, 8))
     
     # 5. 面料一：总体积6.5m³，长度2.2m，数量71
     # 估算其他尺寸：假设每件体积约为 6.5/71 ≈ 0.0915 m³
@@ -166,20 +603,19 @@ def solve_packing_problem():
     fabric1_volume_per_item = 6.5 / 71
     fabric1_cross_section = fabric1_volume_per_item / 2.2
     fabric1_side = fabric1_cross_section ** 0.5
-    boxes.extend([Box("面料一", 2.2, fabric1_side, fabric1_side, 1, i+1) for i in range(71)])
+    cargo.append(Box("面料一", 2.2, fabric1_side, fabric1_side, 71))
     
     # 6. 面料二：总体积18.89m³，长度2.2m，数量未知
     # 假设每件尺寸与面料一类似
     fabric2_items = int(18.89 / fabric1_volume_per_item)
-    boxes.extend([Box("面料二", 2.2, fabric1_side, fabric1_side, 1, i+1) for i in range(fabric2_items)])
+    cargo.append(Box("面料二", 2.2, fabric1_side, fabric1_side, fabric2_items))
+    
+    # 展开为 (货物种类, 编号) 列表，同种货物共享一个 Box
+    boxes = [(box, i + 1) for box in cargo for i in range(box.quantity)]
     
     print("货物清单:")
-    cargo_summary = {}
-    for box in boxes:
-        if box.name not in cargo_summary:
-            cargo_summary[box.name] = {"count": 0, "volume": 0}
-        cargo_summary[box.name]["count"] += 1
-        cargo_summary[box.name]["volume"] += box.volume()
+    cargo_summary = {box.name: {"count": box.quantity, "volume": box.quantity * box.volume()}
+                     for box in cargo}
     
     for name, info in cargo_summary.items():
         print(f"  {name}: {info['count']}件, 总体积 {info['volume']:.2f} m³")
@@ -187,19 +623,21 @@ def solve_packing_problem():
     total_volume = sum(info['volume'] for info in cargo_summary.values())
     print(f"\n已知货物总体积: {total_volume:.2f} m³")
     
-    # 按体积从大到小排序（启发式策略）
-    boxes.sort(key=lambda b: b.volume(), reverse=True)
+    # 按体积从大到小排序（启发式策略），体积按货物种类计算一次后展开
+    volumes = np.repeat([box.volume() for box in cargo], [box.quantity for box in cargo])
+    order = np.argsort(-volumes, kind='stable')
+    boxes = [boxes[i] for i in order]
     
     # 放置货物
     placed_count = 0
     failed_boxes = []
     
     print("\n开始装载货物...")
-    for box in boxes:
-        if container.place_box(box, box.id):
+    for box, box_id in boxes:
+        if container.place_box(box, box_id):
             placed_count += 1
         else:
-            failed_boxes.append(box)
+            failed_boxes.append(Box(box.name, box.length, box.width, box.height, 1, box_id))
     
     print(f"成功放置: {placed_count}/{len(boxes)} 件货物")
     print(f"已使用体积: {container.used_volume():.2f} m³")
@@ -213,18 +651,11 @@ def solve_packing_problem():
     
     # 4. 尝试放置HCS：130×88×80cm
     hcs_box = Box("HCS", 1.30, 0.88, 0.80, 1, 0)
-    hcs_count = 0
-    hcs_id = 1
     
     print(f"\n尝试放置HCS货物 (尺寸: {hcs_box.length}m × {hcs_box.width}m × {hcs_box.height}m, 体积: {hcs_box.volume():.3f} m³)...")
     
-    while True:
-        hcs_test = Box("HCS", hcs_box.length, hcs_box.width, hcs_box.height, 1, hcs_id)
-        if container.place_box(hcs_test, hcs_id):
-            hcs_count += 1
-            hcs_id += 1
-        else:
-            break
+    # 整个循环在编译后的内核中完成，剩余体积不足一包时提前结束
+    hcs_count = container.place_until_full(hcs_box)
     
     print(f"\n最多可以放入 HCS: {hcs_count} 包")
     print(f"HCS 总体积: {hcs_count * hcs_box.volume():.2f} m³")
@@ -234,155 +665,129 @@ def solve_packing_problem():
     
     return container, cargo_summary, hcs_count, failed_boxes
 
-def generate_html_report(container: Container, cargo_summary: Dict, 
-                        hcs_count: int, failed_boxes: List[Box]):
-    """生成HTML可视化报告"""
-    
-    # 统计每种货物的放置情况
-    placement_summary = {}
-    for pos in container.placed_boxes:
-        if pos.box_name not in placement_summary:
-            placement_summary[pos.box_name] = []
-        placement_summary[pos.box_name].append(pos)
-    
-    # 颜色映射
-    colors = {
-        "lyocell": "#FF6B6B",
-        "viscose": "#4ECDC4",
-        "仿羽绒": "#45B7D1",
-        "面料一": "#FFA07A",
-        "面料二": "#98D8C8",
-        "HCS": "#F7DC6F"
-    }
-    
-    html = f"""<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>集装箱装载方案</title>
-    <style>
-        * {{
+# 报告样式表，与数据无关，只需定义一次
+REPORT_STYLE = """    <style>
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             padding: 20px;
             min-height: 100vh;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1400px;
             margin: 0 auto;
             background: white;
             border-radius: 20px;
             box-shadow: 0 20px 60px rgba(0,0,0,0.3);
             overflow: hidden;
-        }}
+        }
         
-        .header {{
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 40px;
             text-align: center;
-        }}
+        }
         
-        .header h1 {{
+        .header h1 {
             font-size: 2.5em;
             margin-bottom: 10px;
-        }}
+        }
         
-        .header p {{
+        .header p {
             font-size: 1.2em;
             opacity: 0.9;
-        }}
+        }
         
-        .content {{
+        .content {
             padding: 40px;
-        }}
+        }
         
-        .summary-grid {{
+        .summary-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 20px;
             margin-bottom: 40px;
-        }}
+        }
         
-        .summary-card {{
+        .summary-card {
             background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
             padding: 25px;
             border-radius: 15px;
             box-shadow: 0 5px 15px rgba(0,0,0,0.1);
             transition: transform 0.3s;
-        }}
+        }
         
-        .summary-card:hover {{
+        .summary-card:hover {
             transform: translateY(-5px);
-        }}
+        }
         
-        .summary-card h3 {{
+        .summary-card h3 {
             color: #2d3748;
             margin-bottom: 10px;
             font-size: 1.1em;
-        }}
+        }
         
-        .summary-card .value {{
+        .summary-card .value {
             font-size: 2em;
             font-weight: bold;
             color: #667eea;
-        }}
+        }
         
-        .summary-card .unit {{
+        .summary-card .unit {
             color: #718096;
             font-size: 0.9em;
-        }}
+        }
         
-        .section {{
+        .section {
             margin-bottom: 40px;
-        }}
+        }
         
-        .section h2 {{
+        .section h2 {
             color: #2d3748;
             margin-bottom: 20px;
             padding-bottom: 10px;
             border-bottom: 3px solid #667eea;
             font-size: 1.8em;
-        }}
+        }
         
-        .cargo-table {{
+        .cargo-table {
             width: 100%;
             border-collapse: collapse;
             margin-bottom: 30px;
             box-shadow: 0 5px 15px rgba(0,0,0,0.1);
             border-radius: 10px;
             overflow: hidden;
-        }}
+        }
         
-        .cargo-table thead {{
+        .cargo-table thead {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
-        }}
+        }
         
-        .cargo-table th {{
+        .cargo-table th {
             padding: 15px;
             text-align: left;
             font-weight: 600;
-        }}
+        }
         
-        .cargo-table td {{
+        .cargo-table td {
             padding: 12px 15px;
             border-bottom: 1px solid #e2e8f0;
-        }}
+        }
         
-        .cargo-table tbody tr:hover {{
+        .cargo-table tbody tr:hover {
             background-color: #f7fafc;
-        }}
+        }
         
-        .color-box {{
+        .color-box {
             display: inline-block;
             width: 20px;
             height: 20px;
@@ -390,60 +795,60 @@ def generate_html_report(container: Container, cargo_summary: Dict,
             margin-right: 10px;
             vertical-align: middle;
             border: 1px solid #ddd;
-        }}
+        }
         
-        .highlight {{
+        .highlight {
             background: #ffd700;
             padding: 20px;
             border-radius: 10px;
             margin: 20px 0;
             border-left: 5px solid #f39c12;
-        }}
+        }
         
-        .highlight h3 {{
+        .highlight h3 {
             color: #2d3748;
             margin-bottom: 10px;
-        }}
+        }
         
-        .highlight .big-number {{
+        .highlight .big-number {
             font-size: 3em;
             font-weight: bold;
             color: #e67e22;
-        }}
+        }
         
-        .visualization {{
+        .visualization {
             margin-top: 30px;
             padding: 20px;
             background: #f7fafc;
             border-radius: 10px;
-        }}
+        }
         
-        .legend {{
+        .legend {
             display: flex;
             flex-wrap: wrap;
             gap: 15px;
             margin-top: 20px;
-        }}
+        }
         
-        .legend-item {{
+        .legend-item {
             display: flex;
             align-items: center;
             padding: 8px 15px;
             background: white;
             border-radius: 8px;
             box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        }}
+        }
         
-        .progress-bar {{
+        .progress-bar {
             width: 100%;
             height: 30px;
             background: #e2e8f0;
             border-radius: 15px;
             overflow: hidden;
             margin: 10px 0;
-        }}
+        }
         
-        .progress-fill {{
+        .progress-fill {
             height: 100%;
             background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
             display: flex;
@@ -452,40 +857,81 @@ def generate_html_report(container: Container, cargo_summary: Dict,
             color: white;
             font-weight: bold;
             transition: width 0.3s;
-        }}
+        }
         
-        .detail-table {{
+        .detail-table {
             width: 100%;
             margin-top: 20px;
             font-size: 0.9em;
-        }}
+        }
         
-        .detail-table th {{
+        .detail-table th {
             background: #edf2f7;
             padding: 10px;
             text-align: left;
             font-weight: 600;
             color: #2d3748;
-        }}
+        }
         
-        .detail-table td {{
+        .detail-table td {
             padding: 8px 10px;
             border-bottom: 1px solid #e2e8f0;
-        }}
+        }
         
-        .warning {{
+        .warning {
             background: #fff3cd;
             border-left: 5px solid #ffc107;
             padding: 15px;
             border-radius: 5px;
             margin: 20px 0;
-        }}
+        }
         
-        .warning h4 {{
+        .warning h4 {
             color: #856404;
             margin-bottom: 10px;
-        }}
-    </style>
+        }
+    </style>"""
+
+def generate_html_report(container: Container, cargo_summary: Dict, 
+                        hcs_count: int, failed_boxes: List[Box]):
+    """生成HTML可视化报告"""
+    
+    # 统计每种货物的放置情况：按 name_id 计数和汇总体积
+    placed = container.positions
+    name_table = container.name_table
+    counts = np.bincount(placed['name_id'], minlength=len(name_table))
+    volumes = np.bincount(placed['name_id'], weights=placed['l'] * placed['w'] * placed['h'],
+                          minlength=len(name_table))
+    placement_summary = {name: name_id for name_id, name in enumerate(name_table)
+                         if counts[name_id] > 0}
+    # 按 name_id 稳定排序一次，每种货物的记录就是其中连续的一段
+    by_name = placed[np.argsort(placed['name_id'], kind='stable')]
+    starts = np.cumsum(counts) - counts
+    
+    # 报告中反复用到的汇总数值，只计算一次
+    total = container.volume()
+    used = container.used_volume()
+    avail = total - used
+    pct = used / total * 100
+    hcs_vol = hcs_count * 1.30 * 0.88 * 0.80
+    
+    # 颜色映射
+    colors = {
+        "lyocell": "#FF6B6B",
+        "viscose": "#4ECDC4",
+        "仿羽绒": "#45B7D1",
+        "面料一": "#FFA07A",
+        "面料二": "#98D8C8",
+        "HCS": "#F7DC6F"
+    }
+    
+    parts = ["""<!DOCTYPE html>
+<html lang="zh-CN">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>集装箱装载方案</title>
+""", REPORT_STYLE, f"""
 </head>
 <body>
     <div class="container">
@@ -499,29 +945,29 @@ def generate_html_report(container: Container, cargo_summary: Dict,
             <div class="summary-grid">
                 <div class="summary-card">
                     <h3>集装箱容积</h3>
-                    <div class="value">{container.volume():.2f}</div>
+                    <div class="value">{total:.2f}</div>
                     <div class="unit">立方米</div>
                 </div>
                 <div class="summary-card">
                     <h3>已使用体积</h3>
-                    <div class="value">{container.used_volume():.2f}</div>
+                    <div class="value">{used:.2f}</div>
                     <div class="unit">立方米</div>
                 </div>
                 <div class="summary-card">
                     <h3>剩余体积</h3>
-                    <div class="value">{container.available_volume():.2f}</div>
+                    <div class="value">{avail:.2f}</div>
                     <div class="unit">立方米</div>
                 </div>
                 <div class="summary-card">
                     <h3>空间利用率</h3>
-                    <div class="value">{(container.used_volume()/container.volume()*100):.1f}%</div>
+                    <div class="value">{pct:.1f}%</div>
                     <div class="unit">利用率</div>
                 </div>
             </div>
             
             <div class="progress-bar">
-                <div class="progress-fill" style="width: {(container.used_volume()/container.volume()*100):.1f}%">
-                    {(container.used_volume()/container.volume()*100):.1f}% 已使用
+                <div class="progress-fill" style="width: {pct:.1f}%">
+                    {pct:.1f}% 已使用
                 </div>
             </div>
             
@@ -530,7 +976,7 @@ def generate_html_report(container: Container, cargo_summary: Dict,
                 <h3>💡 HCS 最大装载量</h3>
                 <div class="big-number">{hcs_count} 包</div>
                 <p>在装载所有其他货物后，最多可以放入 <strong>{hcs_count}</strong> 包 HCS (每包尺寸: 130×88×80cm)</p>
-                <p>HCS 总体积: <strong>{hcs_count * 1.30 * 0.88 * 0.80:.2f}</strong> 立方米</p>
+                <p>HCS 总体积: <strong>{hcs_vol:.2f}</strong> 立方米</p>
             </div>
             
             <!-- 货物统计 -->
@@ -547,64 +993,64 @@ def generate_html_report(container: Container, cargo_summary: Dict,
                         </tr>
                     </thead>
                     <tbody>
-"""
+"""]
     
     # 添加货物统计行
     for name in sorted(placement_summary.keys()):
-        positions = placement_summary[name]
-        count = len(positions)
-        if count > 0:
-            sample = positions[0]
-            volume = sum(p.length * p.width * p.height for p in positions)
-            percentage = (volume / container.used_volume() * 100) if container.used_volume() > 0 else 0
-            color = colors.get(name, "#CCCCCC")
-            
-            html += f"""
+        name_id = placement_summary[name]
+        count = counts[name_id]
+        sample = by_name[starts[name_id]]
+        volume = volumes[name_id]
+        percentage = (volume / used * 100) if used > 0 else 0
+        color = colors.get(name, "#CCCCCC")
+        
+        parts.append(f"""
                         <tr>
                             <td>
                                 <span class="color-box" style="background-color: {color};"></span>
                                 <strong>{name}</strong>
                             </td>
-                            <td>{sample.length*100:.0f} × {sample.width*100:.0f} × {sample.height*100:.0f}</td>
+                            <td>{sample['l']*100:.0f} × {sample['w']*100:.0f} × {sample['h']*100:.0f}</td>
                             <td>{count} 包</td>
                             <td>{volume:.2f}</td>
                             <td>{percentage:.1f}%</td>
                         </tr>
-"""
+""")
     
-    html += """
+    parts.append("""
                     </tbody>
                 </table>
             </div>
-"""
+""")
     
     # 如果有无法放入的货物，显示警告
     if failed_boxes:
-        html += """
+        parts.append("""
             <div class="warning">
                 <h4>⚠️ 警告：部分货物无法放入</h4>
                 <p>以下货物由于空间限制无法放入集装箱：</p>
                 <ul>
-"""
+""")
         for box in failed_boxes:
-            html += f"                    <li>{box.name} (ID: {box.id})</li>\n"
-        html += """
+            parts.append(f"                    <li>{box.name} (ID: {box.id})</li>\n")
+        parts.append("""
                 </ul>
             </div>
-"""
+""")
     
     # 详细摆放信息
-    html += """
+    parts.append("""
             <div class="section">
                 <h2>📋 详细摆放信息</h2>
                 <p>以下是每个货物在集装箱中的具体位置（坐标单位：米）</p>
-"""
+""")
     
     for name in sorted(placement_summary.keys()):
-        positions = placement_summary[name]
+        name_id = placement_summary[name]
+        positions = by_name[starts[name_id]:starts[name_id] + counts[name_id]]
         color = colors.get(name, "#CCCCCC")
         
-        html += f"""
+        parts.append(f"""
                 <h3 style="margin-top: 20px; color: {color};">
                     <span class="color-box" style="background-color: {color};"></span>
                     {name} ({len(positions)} 包)
@@ -623,49 +1069,49 @@ def generate_html_report(container: Container, cargo_summary: Dict,
                         </tr>
                     </thead>
                     <tbody>
-"""
+""")
         
-        for pos in sorted(positions, key=lambda p: p.box_id):
-            volume = pos.length * pos.width * pos.height
-            html += f"""
+        for pos in positions[np.argsort(positions['box_id'], kind='stable')]:
+            volume = pos['l'] * pos['w'] * pos['h']
+            parts.append(f"""
                         <tr>
-                            <td>{pos.box_id}</td>
-                            <td>{pos.x:.2f}</td>
-                            <td>{pos.y:.2f}</td>
-                            <td>{pos.z:.2f}</td>
-                            <td>{pos.length:.2f}</td>
-                            <td>{pos.width:.2f}</td>
-                            <td>{pos.height:.2f}</td>
+                            <td>{pos['box_id']}</td>
+                            <td>{pos['x']:.2f}</td>
+                            <td>{pos['y']:.2f}</td>
+                            <td>{pos['z']:.2f}</td>
+                            <td>{pos['l']:.2f}</td>
+                            <td>{pos['w']:.2f}</td>
+                            <td>{pos['h']:.2f}</td>
                             <td>{volume:.3f}</td>
                         </tr>
-"""
+""")
         
-        html += """
+        parts.append("""
                     </tbody>
                 </table>
-"""
+""")
     
-    html += """
+    parts.append("""
             </div>
             
             <!-- 图例 -->
             <div class="visualization">
                 <h3>🎨 颜色图例</h3>
                 <div class="legend">
-"""
+""")
     
     for name, color in colors.items():
         if name in placement_summary or name == "HCS":
-            count = len(placement_summary.get(name, [])) if name != "HCS" else hcs_count
+            count = counts[placement_summary[name]] if name != "HCS" else hcs_count
             if count > 0 or name == "HCS":
-                html += f"""
+                parts.append(f"""
                     <div class="legend-item">
                         <span class="color-box" style="background-color: {color};"></span>
                         <span>{name}</span>
                     </div>
-"""
+""")
     
-    html += """
+    parts.append("""
                 </div>
             </div>
             
@@ -673,7 +1119,7 @@ def generate_html_report(container: Container, cargo_summary: Dict,
                 <h3>📝 说明</h3>
                 <ul style="line-height: 1.8; color: #4a5568;">
                     <li>集装箱尺寸：11.9m (长) × 2.34m (宽) × 2.67m (高)</li>
-                    <li>装载算法：采用启发式3D装箱算法（First Fit Decreasing）</li>
+                    <li>装载算法：采用启发式3D装箱算法（First Fit Decreasing，极点法选取底-深-左优先、底面完全受支撑的摆放位置）</li>
                     <li>坐标系统：原点(0,0,0)位于集装箱左下后角</li>
                     <li>面料一和面料二：由于缺少完整尺寸信息，根据总体积和长度进行估算</li>
                     <li>货物可能会自动旋转以获得最佳摆放</li>
@@ -683,9 +1129,9 @@ def generate_html_report(container: Container, cargo_summary: Dict,
     </div>
 </body>
 </html>
-"""
+""")
     
-    return html
+    return "".join(parts)
 
 if __name__ == "__main__":
     print("=" * 60)
@@ -693,6 +1139,8 @@ if __name__ == "__main__":
     print("=" * 60)
     print()
     
+    _warm_up()
+    
     # 执行装箱计算
     container, cargo_summary, hcs_count, failed_boxes = solve_packing_problem()
     
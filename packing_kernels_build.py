@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+预编译（AOT）装箱内核
+运行本脚本会在同目录下生成 packing_kernels 扩展模块，
+container_packing 导入时优先使用它，从而省去首次运行时的 JIT 编译。
+"""
+
+import os
+import sys
+
+from numba.pycc import CC
+
+# 从 Python 源码编译，而不是使用已存在的旧版扩展模块
+sys.modules['packing_kernels'] = None
+import container_packing as cp
+
+cc = CC('packing_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+KERNEL_VERSION = cp.KERNEL_VERSION
+
+
+@cc.export('version', 'i8()')
+def version():
+    """编译时内核源码的指纹，导入时与 container_packing.KERNEL_VERSION 比较"""
+    return KERNEL_VERSION
+
+
+cc.export('slab_range', 'UniTuple(i8, 2)(f8, f8, f8, i8)')(cp._slab_range.py_func)
+cc.export('grid_insert', 'b1(i8[:, :], i8[:], f8, f8[:, :], i8)')(cp._grid_insert.py_func)
+cc.export('find_pos',
+          'Tuple((b1, f8, f8, f8))(f8[:, :], i8[:, :], i8[:], f8, f8, f8, f8, '
+          'f8, f8, f8, f8[:], f8[:], f8[:])')(cp._find_pos.py_func)
+cc.export('fitting_points',
+          'f8[:, :](f8[:, :], f8[:, :], f8, f8, f8)')(cp._fitting_points.py_func)
+cc.export('find_pos_rotations',
+          'Tuple((b1, i8, f8, f8, f8))(f8[:, :], i8[:, :], i8[:], f8, f8, f8, f8, '
+          'f8[:, :], f8[:], f8[:], f8[:])')(cp._find_pos_rotations.py_func)
+cc.export('update_extreme_points',
+          'f8[:, :](f8[:, :], i8, i8[:, :], i8[:], f8, f8[:, :], f8, f8, f8)')(
+              cp._update_extreme_points.py_func)
+cc.export('pack_repeated',
+          'Tuple((i8, f8[:, :], b1))(f8[:, :], i8, i8[:, :], i8[:], f8, f8[:, :], '
+          'f8[:, :], i8[:], f8, f8, f8, f8)')(cp._pack_repeated.py_func)
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"✅ 已生成 {cc.output_file}")